@@ -547,7 +547,8 @@ class LLMMonitorDaemon:
         prompt_file = self.project_dir / 'workers' / f'{worker_id}.md'
         if prompt_file.exists():
             try:
-                worker_prompt = prompt_file.read_text()[:1000]  # First 1000 chars
+                with open(prompt_file) as f:
+                    worker_prompt = f.read(1000)  # First 1000 chars
             except:
                 pass
 
@@ -4,15 +4,118 @@ Memory Manager - Python module for Czarina memory operations
 Provides structured access to memories.md with validation and parsing
 """
 
+import mmap
 import os
 import re
+import shutil
+import tempfile
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Tuple
+
+# Fixed patterns, compiled once at import
+_SECTION_HDR_RE = re.compile(r'^## (.*)$', re.MULTILINE)
+_SESSION_HDR_RE = re.compile(r'^### Session: (\d{4}-\d{2}-\d{2}) - (.+?)$', re.MULTILINE)
+_PATTERNS_HDR_RE = re.compile(r'^## Patterns and Decisions$', re.MULTILINE)
+
+# Top-level sections every memory file must have, in document order
+_REQUIRED_SECTIONS = (
+    "Architectural Core",
+    "Project Knowledge",
+    "Patterns and Decisions",
+)
+
+# Matches the file header (group 1) or any required section header (group 2)
+_VALIDATION_RE = re.compile(
+    r'^(?:(# Project Memory:)|## (' + '|'.join(re.escape(name) for name in _REQUIRED_SECTIONS) + r')$)',
+    re.MULTILINE
+)
+_REQUIRED_STRUCTURE = frozenset(("# Project Memory:",) + _REQUIRED_SECTIONS)
+
+# Shared result for a valid file
+_NO_ERRORS: Tuple[str, ...] = ()
+
+# Byte-mode patterns for counting directly on the mapped file. The file is
+# not newline-translated, so \r\n and bare \r also end a line, as they do
+# when the text is read with universal newlines.
+_SESSION_COUNT_BRE = re.compile(rb'(?:^|(?<=\r))### Session:', re.MULTILINE)
+_PATTERN_COUNT_BRE = re.compile(rb'(?:^|(?<=\r))### \[[^\r\n]+\](?=\r|$)', re.MULTILINE)
+
+# Slice size used when counting line endings in a mapped file
+_COUNT_CHUNK = 1 << 20
+
+
+def _new_file_mode() -> int:
+    """Mode a plain open() gives a new file under the current umask"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+# Reading the umask means setting it, so do it once at import rather than
+# flipping process-wide state on every write
+_NEW_FILE_MODE = _new_file_mode()
+
+# Session subsections recognised by the parser
+_SUBSECTION_NAMES = frozenset({
+    "What We Did",
+    "What Broke",
+    "Root Cause",
+    "Resolution",
+    "Prevention",
+})
+
+
+def _find_session_header(text: str, start: int) -> int:
+    """Find the start of the next line after start beginning with '### Session: ', or -1"""
+    if start == 0 and text.startswith("### Session: "):
+        return 0
+    pos = text.find("\n### Session: ", start)
+    return pos + 1 if pos != -1 else -1
+
+
+def _subsection_text(lines: Optional[List[str]]) -> str:
+    """Join the lines collected for a subsection into its text"""
+    if not lines:
+        return ""
+    return "\n".join(lines).strip()
+
+
+def _bullet_items(text: str) -> List[str]:
+    """Extract non-empty '- ' bullet items from text"""
+    return [line[2:] for line in text.split("\n") if line.startswith("- ") and len(line) > 2]
+
+
+def _subsection_bullets(lines: Optional[List[str]]) -> List[str]:
+    """Extract bullet items from the lines collected for a subsection"""
+    return _bullet_items(_subsection_text(lines))
+
+
+def _file_signature(st: os.stat_result) -> Tuple[int, int, int, int]:
+    """
+    Stat fields that identify one version of a file's content
+
+    mtime alone misses rewrites within one timestamp tick and mtimes set
+    back with utime. A replaced file has a new inode, a resized one a new
+    size, and any write or utime call moves ctime. Only a same-size,
+    in-place rewrite within a single tick still goes unnoticed.
+    """
+    return (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
+def _count_line_endings(data: mmap.mmap) -> int:
+    """Count \\n, \\r\\n and bare \\r line endings in mapped bytes, a slice at a time"""
+    count = 0
+    for i in range(0, len(data), _COUNT_CHUNK):
+        chunk = data[i:i + _COUNT_CHUNK + 1]
+        body = chunk[:_COUNT_CHUNK]
+        # The extra byte catches a \r\n split across slices; each pair is
+        # only counted in the slice where its \r falls
+        count += body.count(b'\n') + body.count(b'\r') - chunk.count(b'\r\n')
+    return count
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEntry:
     """Represents a single session entry in memory"""
     date: str
@@ -30,7 +133,7 @@ class SessionEntry:
         return f"Session: {self.date} - {self.description}"
 
 
-@dataclass
+@dataclass(slots=True)
 class PatternEntry:
     """Represents a pattern or decision entry"""
     name: str
@@ -47,29 +150,49 @@ class MemoryFile:
     def __init__(self, file_path: str = ".czarina/memories.md"):
         self.file_path = Path(file_path)
         self._content: Optional[str] = None
+        self._signature: Optional[Tuple[int, int, int, int]] = None
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None
+        self._dir_ready = False
 
     def exists(self) -> bool:
         """Check if memory file exists"""
         return self.file_path.exists()
 
     def read(self) -> str:
-        """Read the entire memory file"""
-        if not self.exists():
+        """Read the entire memory file, reusing the cached copy if unchanged on disk"""
+        try:
+            st = os.stat(self.file_path)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Memory file not found: {self.file_path}")
 
+        if self._content is not None and _file_signature(st) == self._signature:
+            return self._content
+
         with open(self.file_path, 'r', encoding='utf-8') as f:
             self._content = f.read()
+        self._signature = _file_signature(st)
+        self._index = None
         return self._content
 
+    def invalidate(self) -> None:
+        """Drop the cached file content so the next read goes to disk"""
+        self._content = None
+        self._signature = None
+        self._index = None
+
     def write(self, content: str) -> None:
-        """Write content to memory file"""
-        # Ensure parent directory exists
-        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        """Write content to memory file, skipping the write if nothing changed"""
+        if content == self._content:
+            try:
+                if _file_signature(os.stat(self.file_path)) == self._signature:
+                    return
+            except FileNotFoundError:
+                pass
 
-        with open(self.file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        self._write_parts(content)
 
         self._content = content
+        self._signature = _file_signature(os.stat(self.file_path))
 
     def read_section(self, section_name: str) -> str:
         """
@@ -81,16 +204,26 @@ class MemoryFile:
         Returns:
             Content of the section
         """
-        content = self._content or self.read()
-
-        # Pattern to match section header to next section or end
-        pattern = rf'^## {re.escape(section_name)}$(.*?)(?=^## |\Z)'
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
+        start, end = self._section_index().get(section_name, (0, 0))
+        return self._content[start:end].strip()
 
-        if match:
-            return match.group(1).strip()
+    def _section_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Map each ``## `` section name to the (start, end) offsets of its body
 
-        return ""
+        Built once per file content so that repeated section reads are
+        slices rather than full-file searches. The first section with a
+        given name wins.
+        """
+        content = self.read()
+        if self._index is None:
+            headers = list(_SECTION_HDR_RE.finditer(content))
+            ends = [match.start() for match in headers[1:]] + [len(content)]
+            index: Dict[str, Tuple[int, int]] = {}
+            for match, end in zip(headers, ends):
+                index.setdefault(match.group(1), (match.end(), end))
+            self._index = index
+        return self._index
 
     def read_architectural_core(self) -> str:
         """Read the Architectural Core section"""
@@ -111,76 +244,63 @@ class MemoryFile:
         Returns:
             List of SessionEntry objects
         """
-        knowledge = self.read_project_knowledge()
-        sessions: List[SessionEntry] = []
+        return list(self._iter_sessions(self.read_project_knowledge()))
 
-        # Split by session headers
-        session_pattern = r'^### Session: (\d{4}-\d{2}-\d{2}) - (.+?)$'
-        parts = re.split(session_pattern, knowledge, flags=re.MULTILINE)
+    def _iter_sessions(self, knowledge: str) -> Iterator[SessionEntry]:
+        """
+        Yield session entries from Project Knowledge text
 
-        # parts[0] is content before first session (comments, etc.)
-        # Then alternating: date, description, content, date, description, content...
-        for i in range(1, len(parts), 3):
-            if i + 2 > len(parts):
-                break
+        Session headers are located with str.find and checked with a single
+        anchored match; each session's content is then parsed line by line.
+        """
+        header = None
+        content_start = 0
+        pos = _find_session_header(knowledge, 0)
+
+        while pos != -1:
+            line_end = knowledge.find("\n", pos)
+            if line_end == -1:
+                line_end = len(knowledge)
 
-            date = parts[i]
-            description = parts[i + 1]
-            content = parts[i + 2]
+            match = _SESSION_HDR_RE.match(knowledge, pos, line_end)
+            if match:
+                if header is not None:
+                    yield self._parse_session_content(*header, knowledge[content_start:pos])
+                header = match.groups()
+                content_start = line_end
 
-            # Parse session content sections
-            session = self._parse_session_content(date, description, content)
-            if session:
-                sessions.append(session)
+            pos = _find_session_header(knowledge, line_end)
 
-        return sessions
+        if header is not None:
+            yield self._parse_session_content(*header, knowledge[content_start:])
 
-    def _parse_session_content(self, date: str, description: str, content: str) -> Optional[SessionEntry]:
+    def _parse_session_content(self, date: str, description: str, content: str) -> SessionEntry:
         """Parse the content of a single session entry"""
-        try:
-            # Extract subsections
-            what_we_did = self._extract_list_section(content, "What We Did")
-            what_broke = self._extract_list_section(content, "What Broke")
-            root_cause = self._extract_text_section(content, "Root Cause")
-            resolution = self._extract_text_section(content, "Resolution")
-            prevention = self._extract_list_section(content, "Prevention")
-
-            return SessionEntry(
-                date=date,
-                description=description,
-                what_we_did=what_we_did,
-                what_broke=what_broke,
-                root_cause=root_cause,
-                resolution=resolution,
-                prevention=prevention,
-                raw_content=content
-            )
-        except Exception as e:
-            print(f"Warning: Failed to parse session {date}: {e}")
-            return None
-
-    def _extract_list_section(self, content: str, section_name: str) -> List[str]:
-        """Extract a list section (bullet points)"""
-        pattern = rf'^#### {re.escape(section_name)}$(.*?)(?=^#### |\Z)'
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-
-        if not match:
-            return []
-
-        section_text = match.group(1).strip()
-        # Extract bullet points
-        items = re.findall(r'^- (.+)$', section_text, re.MULTILINE)
-        return items
-
-    def _extract_text_section(self, content: str, section_name: str) -> str:
-        """Extract a text section"""
-        pattern = rf'^#### {re.escape(section_name)}$(.*?)(?=^#### |\Z)'
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL)
-
-        if not match:
-            return ""
-
-        return match.group(1).strip()
+        buckets: Dict[str, List[str]] = {}
+        current: Optional[List[str]] = None
+
+        for line in content.split("\n"):
+            if line.startswith("#### "):
+                # Any subsection header ends the current one; only the
+                # first occurrence of a known subsection is collected
+                name = line[5:]
+                if name in _SUBSECTION_NAMES and name not in buckets:
+                    current = buckets[name] = []
+                else:
+                    current = None
+            elif current is not None:
+                current.append(line)
+
+        return SessionEntry(
+            date=date,
+            description=description,
+            what_we_did=_subsection_bullets(buckets.get("What We Did")),
+            what_broke=_subsection_bullets(buckets.get("What Broke")),
+            root_cause=_subsection_text(buckets.get("Root Cause")),
+            resolution=_subsection_text(buckets.get("Resolution")),
+            prevention=_subsection_bullets(buckets.get("Prevention")),
+            raw_content=content
+        )
 
     def append_session(self, session: SessionEntry) -> None:
         """
@@ -189,106 +309,123 @@ class MemoryFile:
         Args:
             session: SessionEntry to append
         """
-        content = self._content or self.read()
+        content = self.read()
 
         # Format the session entry
         session_md = self._format_session(session)
 
         # Find the Patterns and Decisions section
-        pattern = r'^## Patterns and Decisions$'
-        match = re.search(pattern, content, re.MULTILINE)
+        match = _PATTERNS_HDR_RE.search(content)
 
         if match:
             # Insert before Patterns and Decisions
             insert_pos = match.start()
-            new_content = (
-                content[:insert_pos] +
-                session_md + "\n\n" +
-                content[insert_pos:]
-            )
+            self._write_parts(content[:insert_pos], session_md, "\n\n", content[insert_pos:])
         else:
             # Append to end if section not found
-            new_content = content + "\n\n" + session_md
+            self._write_parts(content, "\n\n", session_md)
 
-        self.write(new_content)
+    def _write_parts(self, *parts: str) -> None:
+        """
+        Replace the memory file with the concatenation of parts
+
+        Parts are streamed to a temporary file next to the real file which
+        is then renamed over it, so the full new content is never built as
+        one string and readers never see a partial file. A symlinked memory
+        file is followed, so the link is kept and its target updated.
+        """
+        self.invalidate()
+
+        # Ensure parent directory exists (once per instance)
+        if not self._dir_ready:
+            self.file_path.parent.mkdir(parents=True, exist_ok=True)
+            self._dir_ready = True
+
+        target = os.path.realpath(self.file_path)
+        target_dir, target_name = os.path.split(target)
+        fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix=f".{target_name}.")
+        try:
+            with open(fd, 'w', encoding='utf-8') as f:
+                for part in parts:
+                    f.write(part)
+            try:
+                shutil.copymode(target, tmp_path)
+            except FileNotFoundError:
+                # New file: use the mode a plain open() would have given it
+                os.chmod(tmp_path, _NEW_FILE_MODE)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
 
     def _format_session(self, session: SessionEntry) -> str:
         """Format a session entry as markdown"""
-        lines = [
+        parts = [
             f"### Session: {session.date} - {session.description}",
-            "",
-            "#### What We Did"
+            "\n".join(("#### What We Did", *(f"- {item}" for item in session.what_we_did)))
         ]
 
-        for item in session.what_we_did:
-            lines.append(f"- {item}")
-
         if session.what_broke:
-            lines.append("")
-            lines.append("#### What Broke")
-            for item in session.what_broke:
-                lines.append(f"- {item}")
+            parts.append("\n".join(("#### What Broke", *(f"- {item}" for item in session.what_broke))))
 
         if session.root_cause:
-            lines.append("")
-            lines.append("#### Root Cause")
-            lines.append(session.root_cause)
+            parts.append(f"#### Root Cause\n{session.root_cause}")
 
         if session.resolution:
-            lines.append("")
-            lines.append("#### Resolution")
-            lines.append(session.resolution)
+            parts.append(f"#### Resolution\n{session.resolution}")
 
         if session.prevention:
-            lines.append("")
-            lines.append("#### Prevention")
-            for item in session.prevention:
-                lines.append(f"- {item}")
+            parts.append("\n".join(("#### Prevention", *(f"- {item}" for item in session.prevention))))
 
-        return "\n".join(lines)
+        return "\n\n".join(parts)
 
-    def validate(self) -> tuple[bool, List[str]]:
+    def validate(self) -> Tuple[bool, Tuple[str, ...]]:
         """
         Validate the memory file structure
 
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
-
         if not self.exists():
-            errors.append(f"Memory file not found: {self.file_path}")
-            return False, errors
+            return False, (f"Memory file not found: {self.file_path}",)
 
         content = self.read()
 
-        # Check for required sections
-        if not re.search(r'^# Project Memory:', content, re.MULTILINE):
-            errors.append("Missing required header: # Project Memory:")
-
-        required_sections = [
-            "Architectural Core",
-            "Project Knowledge",
-            "Patterns and Decisions"
-        ]
+        # Find the header and required sections in one pass, stopping
+        # as soon as everything has been seen
+        found = set()
+        for match in _VALIDATION_RE.finditer(content):
+            found.add(match.group(1) or match.group(2))
+            if len(found) == len(_REQUIRED_STRUCTURE):
+                return True, _NO_ERRORS
 
-        for section in required_sections:
-            if not re.search(rf'^## {re.escape(section)}$', content, re.MULTILINE):
-                errors.append(f"Missing required section: ## {section}")
+        errors = []
+        if "# Project Memory:" not in found:
+            errors.append("Missing required header: # Project Memory:")
+        errors.extend(
+            f"Missing required section: ## {section}"
+            for section in _REQUIRED_SECTIONS
+            if section not in found
+        )
 
-        return len(errors) == 0, errors
+        return False, tuple(errors)
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the memory file"""
-        if not self.exists():
+        try:
+            size_bytes = self.file_path.stat().st_size
+        except FileNotFoundError:
             return {}
 
-        content = self.read()
-
-        sessions = len(re.findall(r'^### Session:', content, re.MULTILINE))
-        patterns = len(re.findall(r'^### \[.+\]$', content, re.MULTILINE))
-        lines = content.count('\n') + 1
-        size_bytes = len(content.encode('utf-8'))
+        # Count on the raw bytes; nothing here needs the decoded text.
+        # Empty files cannot be mapped and have nothing to count.
+        lines, sessions, patterns = 1, 0, 0
+        if size_bytes:
+            with open(self.file_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                lines += _count_line_endings(data)
+                sessions = len(_SESSION_COUNT_BRE.findall(data))
+                patterns = len(_PATTERN_COUNT_BRE.findall(data))
 
         return {
             'file_path': str(self.file_path),
@@ -312,6 +449,7 @@ def create_session_template(date: Optional[str] = None, description: str = "") -
         SessionEntry template
     """
     if date is None:
+        from datetime import datetime
         date = datetime.now().strftime("%Y-%m-%d")
 
     return SessionEntry(
@@ -338,7 +476,8 @@ def main():
         sys.exit(1)
 
     command = sys.argv[1]
-    memory = MemoryFile()
+    # Same override memory-manager.sh honours
+    memory = MemoryFile(os.environ.get("CZARINA_MEMORY_FILE", ".czarina/memories.md"))
 
     if command == "validate":
         is_valid, errors = memory.validate()
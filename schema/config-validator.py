@@ -6,13 +6,69 @@ Validates config.json files against the Czarina configuration schema.
 Supports loading, validating, and checking backward compatibility.
 """
 
+import functools
 import json
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import jsonschema
 from jsonschema import validate, ValidationError, Draft7Validator
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Fields added in v0.7.0 and how they are reported, in report order
+_NEW_GLOBAL_FIELDS = (
+    ("agent_rules", "Global agent_rules configuration"),
+    ("memory", "Global memory configuration"),
+)
+_NEW_WORKER_FIELDS = (
+    ("role", "role field"),
+    ("rules", "rules configuration"),
+    ("memory", "memory configuration"),
+)
+
+# Top-level sections get_summary reads besides the workers
+_SUMMARY_KEYS = ("project",) + tuple(field for field, _ in _NEW_GLOBAL_FIELDS)
+
+# summary streams configs at least this large instead of loading them whole;
+# below it a full load is faster and its memory cost doesn't matter
+_STREAM_MIN_BYTES = 16 << 20
+
+
+class ConfigLoadError(Exception):
+    """Raised when a config file cannot be read or parsed."""
+
+
+def _load_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(schema_path: str, mtime_ns: int) -> Draft7Validator:
+    """
+    Load a schema and build its validator.
+
+    Cached per (resolved path, mtime) so validators created in the same
+    process share one checked, compiled schema until the file changes.
+    """
+    schema = _load_json(schema_path)
+    Draft7Validator.check_schema(schema)
+    return Draft7Validator(schema)
+
 
 class ConfigValidator:
     """Validates Czarina config.json files against the schema."""
@@ -24,25 +80,56 @@ class ConfigValidator:
         Args:
             schema_path: Path to config-schema.json. If None, uses default location.
         """
+        # Root prechecks in validate_config assume the bundled schema's root
+        self._bundled_schema = schema_path is None
         if schema_path is None:
             # Default to schema in same directory as this script
             schema_path = Path(__file__).parent / "config-schema.json"
 
         self.schema_path = schema_path
-        self.schema = self._load_schema()
-        self.validator = Draft7Validator(self.schema)
 
-    def _load_schema(self) -> Dict:
-        """Load the JSON schema."""
+    @functools.cached_property
+    def validator(self) -> Draft7Validator:
+        """Schema validator, loaded on first use so commands that don't validate skip it."""
+        return self._load_validator()
+
+    @functools.cached_property
+    def schema(self) -> Dict:
+        """The parsed JSON schema."""
+        return self.validator.schema
+
+    @functools.cached_property
+    def _root_checks(self) -> Optional[Tuple[str, ...]]:
+        """
+        Required root keys to check without the validator, or None.
+
+        Only used with the bundled schema, whose root is just "type",
+        "required" and "properties": a non-object config then has the type
+        error alone, and a missing required key is the error validate()
+        reports first. Custom schemas always go through the validator.
+        """
+        if not self._bundled_schema or not isinstance(self.schema, dict):
+            return None
+        if self.schema.get("type") != "object":
+            return None
+        return tuple(self.schema.get("required", ()))
+
+    def _load_validator(self) -> Draft7Validator:
+        """Load the JSON schema and its validator, reusing them while the file is unchanged."""
         try:
-            with open(self.schema_path, 'r') as f:
-                return json.load(f)
+            return _get_validator(
+                str(self.schema_path.resolve()),
+                self.schema_path.stat().st_mtime_ns
+            )
         except FileNotFoundError:
             print(f"Error: Schema file not found at {self.schema_path}", file=sys.stderr)
             sys.exit(1)
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON in schema file: {e}", file=sys.stderr)
             sys.exit(1)
+        except jsonschema.SchemaError as e:
+            print(f"Error: Invalid schema: {e.message}", file=sys.stderr)
+            sys.exit(1)
 
     def load_config(self, config_path: Path) -> Dict:
         """
@@ -53,60 +140,122 @@ class ConfigValidator:
 
         Returns:
             Parsed config dictionary
+
+        Raises:
+            ConfigLoadError: If the file is missing, unreadable or not valid JSON
         """
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            return _load_json(config_path)
         except FileNotFoundError:
-            print(f"Error: Config file not found at {config_path}", file=sys.stderr)
-            sys.exit(1)
+            raise ConfigLoadError(f"Config file not found at {config_path}") from None
+        except OSError as e:
+            raise ConfigLoadError(f"Cannot read config file {config_path}: {e.strerror or e}") from None
         except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in config file: {e}", file=sys.stderr)
-            sys.exit(1)
+            raise ConfigLoadError(f"Invalid JSON in config file: {e}") from None
+        except UnicodeDecodeError as e:
+            raise ConfigLoadError(f"Cannot decode config file {config_path}: {e}") from None
 
-    def validate_config(self, config: Dict) -> Tuple[bool, List[str]]:
+    def validate_config(self, config: Dict, fail_fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate a config dictionary against the schema.
 
         Args:
             config: Config dictionary to validate
+            fail_fast: Stop at the first error instead of collecting all of them
 
         Returns:
             Tuple of (is_valid, error_messages)
         """
-        errors = []
+        root_checks = self._root_checks
+        if root_checks is not None and not isinstance(config, dict):
+            # Same report the validator gives, without walking the schema
+            return (False, [f"  [root] {config!r} is not of type 'object'"])
+
+        if fail_fast:
+            # Missing top-level keys are the most common breakage and are
+            # cheap to spot before running the full schema
+            for key in root_checks or ():
+                if key not in config:
+                    return (False, [f"  [root] {key!r} is a required property"])
+
+            try:
+                self.validator.validate(config)
+            except ValidationError as error:
+                return (False, [self._format_error(error)])
+            return (True, [])
 
         # Collect all validation errors
-        for error in self.validator.iter_errors(config):
-            # Format error message with path
-            path = " -> ".join(str(p) for p in error.path) if error.path else "root"
-            errors.append(f"  [{path}] {error.message}")
+        errors = [self._format_error(error) for error in self.validator.iter_errors(config)]
 
         return (len(errors) == 0, errors)
 
-    def validate_file(self, config_path: Path) -> bool:
+    @staticmethod
+    def _format_error(error: ValidationError) -> str:
+        """Format a validation error message with its path."""
+        path = " -> ".join(str(p) for p in error.path) if error.path else "root"
+        return f"  [{path}] {error.message}"
+
+    def validate_file(self, config_path: Path, fail_fast: bool = False) -> bool:
         """
         Validate a config.json file and print results.
 
         Args:
             config_path: Path to config.json
+            fail_fast: Report only the first error
 
         Returns:
             True if valid, False otherwise
         """
         print(f"Validating: {config_path}")
         config = self.load_config(config_path)
-        is_valid, errors = self.validate_config(config)
+        is_valid, errors = self.validate_config(config, fail_fast=fail_fast)
 
         if is_valid:
             print("✓ Valid configuration")
             return True
         else:
-            print("✗ Invalid configuration:")
+            if fail_fast:
+                print("✗ Invalid configuration (first error shown, use --all-errors for all):")
+            else:
+                print("✗ Invalid configuration:")
             for error in errors:
                 print(error)
             return False
 
+    def validate_files(self, config_paths: List[Path], fail_fast: bool = False) -> bool:
+        """
+        Validate several config.json files with this validator and print a summary.
+
+        Args:
+            config_paths: Paths to config.json files
+            fail_fast: Report only the first error for each file
+
+        Returns:
+            True if every file is valid, False otherwise
+        """
+        # Load the schema before the loop so a schema error stops the batch
+        # instead of being reported against every file
+        _ = self.validator
+
+        results = []
+        for config_path in config_paths:
+            try:
+                is_valid = self.validate_file(config_path, fail_fast=fail_fast)
+            except ConfigLoadError as e:
+                # An unreadable file counts as invalid; carry on with the batch
+                print(f"Error: {e}", file=sys.stderr)
+                is_valid = False
+            results.append((config_path, is_valid))
+            print()
+
+        invalid = [path for path, is_valid in results if not is_valid]
+        print(f"Validated {len(results)} file(s): "
+              f"{len(results) - len(invalid)} valid, {len(invalid)} invalid")
+        for path in invalid:
+            print(f"  ✗ {path}")
+
+        return not invalid
+
     def check_backward_compatibility(self, config: Dict) -> Tuple[bool, List[str]]:
         """
         Check if config uses only v0.6.2 fields (backward compatible).
@@ -117,29 +266,71 @@ class ConfigValidator:
         Returns:
             Tuple of (is_backward_compatible, new_features_used)
         """
-        new_features = []
-
-        # Check for new global sections
-        if "agent_rules" in config:
-            new_features.append("Global agent_rules configuration")
-
-        if "memory" in config:
-            new_features.append("Global memory configuration")
+        new_features = self._global_new_features(config)
 
         # Check for new worker fields
         for worker in config.get("workers", []):
-            worker_id = worker.get("id", "unknown")
+            new_features.extend(self._worker_new_features(worker))
 
-            if "role" in worker:
-                new_features.append(f"Worker '{worker_id}': role field")
+        return (len(new_features) == 0, new_features)
 
-            if "rules" in worker:
-                new_features.append(f"Worker '{worker_id}': rules configuration")
+    @staticmethod
+    def _global_new_features(config: Dict) -> List[str]:
+        """List the v0.7.0 global sections used by a config."""
+        return [label for field, label in _NEW_GLOBAL_FIELDS if field in config]
 
-            if "memory" in worker:
-                new_features.append(f"Worker '{worker_id}': memory configuration")
+    @staticmethod
+    def _worker_new_features(worker: Dict) -> List[str]:
+        """List the v0.7.0 fields used by a single worker."""
+        worker_id = worker.get("id", "unknown")
+        return [f"Worker '{worker_id}': {label}" for field, label in _NEW_WORKER_FIELDS if field in worker]
 
-        return (len(new_features) == 0, new_features)
+    def _iter_config_entries(self, config_path: Path) -> Iterator[Tuple[str, Any]]:
+        """
+        Yield the parts of a config file that get_summary reads.
+
+        Each worker is yielded as ("workers.item", worker) and the other
+        top-level sections as (key, value). With ijson installed, configs of
+        _STREAM_MIN_BYTES or more are streamed, one pass per section in
+        _SUMMARY_KEYS and one for the workers, so the workers list is never
+        held in memory. A section pass stops once its key is found, but a
+        section the file lacks, or one stored after the workers, costs a
+        full parse: at worst len(_SUMMARY_KEYS) + 1 = 4 parses per summary.
+        Smaller files load faster whole, through load_config.
+        """
+        try:
+            size = Path(config_path).stat().st_size
+        except FileNotFoundError:
+            raise ConfigLoadError(f"Config file not found at {config_path}") from None
+        except OSError as e:
+            raise ConfigLoadError(f"Cannot read config file {config_path}: {e.strerror or e}") from None
+
+        if ijson is None or size < _STREAM_MIN_BYTES:
+            config = self.load_config(config_path)
+            for key, value in config.items():
+                if key == "workers" and isinstance(value, list):
+                    for worker in value:
+                        yield "workers.item", worker
+                else:
+                    yield key, value
+            return
+
+        try:
+            with open(config_path, 'rb') as f:
+                for key in _SUMMARY_KEYS:
+                    f.seek(0)
+                    # Top-level keys are unique, so stop at the first match
+                    for value in ijson.items(f, key, use_float=True):
+                        yield key, value
+                        break
+
+                f.seek(0)
+                for worker in ijson.items(f, "workers.item", use_float=True):
+                    yield "workers.item", worker
+        except OSError as e:
+            raise ConfigLoadError(f"Cannot read config file {config_path}: {e.strerror or e}") from None
+        except ijson.JSONError as e:
+            raise ConfigLoadError(f"Invalid JSON in config file: {e}") from None
 
     def get_summary(self, config_path: Path) -> str:
         """
@@ -151,7 +342,34 @@ class ConfigValidator:
         Returns:
             Summary string
         """
-        config = self.load_config(config_path)
+        # Workers are summarised as they are read; the other sections are
+        # small and kept for the parts of the summary below
+        config: Dict[str, Any] = {}
+        worker_count = 0
+        worker_lines = []
+        worker_features = []
+        for key, value in self._iter_config_entries(config_path):
+            if key != "workers.item":
+                config[key] = value
+                continue
+
+            worker = value
+            worker_count += 1
+            worker_id = worker.get("id", "unknown")
+            agent = worker.get("agent", "unknown")
+            role = worker.get("role", "not specified")
+            has_rules = "rules" in worker
+            has_memory = "memory" in worker
+
+            worker_lines.append(f"  - {worker_id}")
+            worker_lines.append(f"    Agent: {agent}")
+            worker_lines.append(f"    Role: {role}")
+            worker_lines.append(f"    Branch: {worker.get('branch', 'not specified')}")
+            if has_rules:
+                worker_lines.append(f"    Rules: configured")
+            if has_memory:
+                worker_lines.append(f"    Memory: configured")
+            worker_features.extend(self._worker_new_features(worker))
 
         lines = []
         lines.append(f"Configuration: {config_path}")
@@ -165,23 +383,8 @@ class ConfigValidator:
         lines.append("")
 
         # Workers
-        workers = config.get("workers", [])
-        lines.append(f"Workers: {len(workers)}")
-        for worker in workers:
-            worker_id = worker.get("id", "unknown")
-            agent = worker.get("agent", "unknown")
-            role = worker.get("role", "not specified")
-            has_rules = "rules" in worker
-            has_memory = "memory" in worker
-
-            lines.append(f"  - {worker_id}")
-            lines.append(f"    Agent: {agent}")
-            lines.append(f"    Role: {role}")
-            lines.append(f"    Branch: {worker.get('branch', 'not specified')}")
-            if has_rules:
-                lines.append(f"    Rules: configured")
-            if has_memory:
-                lines.append(f"    Memory: configured")
+        lines.append(f"Workers: {worker_count}")
+        lines.extend(worker_lines)
         lines.append("")
 
         # New features
@@ -199,8 +402,8 @@ class ConfigValidator:
             lines.append("")
 
         # Backward compatibility
-        is_compat, new_features = self.check_backward_compatibility(config)
-        if is_compat:
+        new_features = self._global_new_features(config) + worker_features
+        if not new_features:
             lines.append("Backward Compatibility: v0.6.2 compatible (no new features)")
         else:
             lines.append("Backward Compatibility: Uses v0.7.0 features")
@@ -220,6 +423,7 @@ def main():
         epilog="""
 Examples:
   %(prog)s validate .czarina/config.json
+  %(prog)s validate-batch examples/*.json
   %(prog)s summary .czarina/config.json
   %(prog)s check-compat .czarina/config.json
         """
@@ -227,14 +431,22 @@ Examples:
 
     parser.add_argument(
         "command",
-        choices=["validate", "summary", "check-compat"],
+        choices=["validate", "validate-batch", "summary", "check-compat"],
         help="Command to execute"
     )
 
     parser.add_argument(
-        "config_path",
+        "config_paths",
         type=Path,
-        help="Path to config.json file"
+        nargs="+",
+        metavar="config_path",
+        help="Path to config.json file (validate-batch accepts several)"
+    )
+
+    parser.add_argument(
+        "--all-errors",
+        action="store_true",
+        help="Report every validation error instead of stopping at the first"
     )
 
     parser.add_argument(
@@ -245,14 +457,31 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.command != "validate-batch" and len(args.config_paths) > 1:
+        parser.error(f"{args.command} takes a single config path; use validate-batch for several")
+    args.config_path = args.config_paths[0]
+
     # Initialize validator
     validator = ConfigValidator(schema_path=args.schema)
 
     # Execute command
+    try:
+        _run_command(validator, args)
+    except ConfigLoadError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _run_command(validator: ConfigValidator, args) -> None:
+    """Run a parsed CLI command and exit with its status."""
     if args.command == "validate":
-        is_valid = validator.validate_file(args.config_path)
+        is_valid = validator.validate_file(args.config_path, fail_fast=not args.all_errors)
         sys.exit(0 if is_valid else 1)
 
+    elif args.command == "validate-batch":
+        all_valid = validator.validate_files(args.config_paths, fail_fast=not args.all_errors)
+        sys.exit(0 if all_valid else 1)
+
     elif args.command == "summary":
         print(validator.get_summary(args.config_path))
         sys.exit(0)
@@ -0,0 +1,338 @@
+#!/usr/bin/env bash
+# Test suite for the config validator CLI (schema/config-validator.py)
+# Checks exit codes and report lines for validate, validate-batch and summary
+
+set -uo pipefail
+
+# Colors
+readonly GREEN='\033[0;32m'
+readonly RED='\033[0;31m'
+readonly YELLOW='\033[1;33m'
+readonly NC='\033[0m'
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+VALIDATOR="$PROJECT_ROOT/schema/config-validator.py"
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+# Counters
+TESTS_RUN=0
+TESTS_PASSED=0
+TESTS_FAILED=0
+
+#####################################
+# Test Framework
+#####################################
+
+# run_validator <args...>: sets OUTPUT (stdout+stderr) and EXIT_CODE
+run_validator() {
+    OUTPUT=$(python3 "$VALIDATOR" "$@" 2>&1)
+    EXIT_CODE=$?
+}
+
+pass() {
+    TESTS_PASSED=$((TESTS_PASSED + 1))
+    echo -e "${GREEN}✓ PASS${NC}"
+}
+
+fail() {
+    TESTS_FAILED=$((TESTS_FAILED + 1))
+    echo -e "${RED}✗ FAIL${NC} ($1)"
+    echo "$OUTPUT" | sed 's/^/      /'
+}
+
+# check <description> <expected exit code> [expected output line...]
+check() {
+    local description="$1"
+    local expected_exit="$2"
+    shift 2
+
+    TESTS_RUN=$((TESTS_RUN + 1))
+    echo -n "  Testing: $description ... "
+
+    if [ "$EXIT_CODE" -ne "$expected_exit" ]; then
+        fail "exit code $EXIT_CODE, expected $expected_exit"
+        return
+    fi
+
+    local line
+    for line in "$@"; do
+        if ! grep -qxF -- "$line" <<< "$OUTPUT"; then
+            fail "missing line: $line"
+            return
+        fi
+    done
+
+    pass
+}
+
+# check_absent <description> <line>: the line must not appear in OUTPUT
+check_absent() {
+    TESTS_RUN=$((TESTS_RUN + 1))
+    echo -n "  Testing: $1 ... "
+
+    if grep -qF -- "$2" <<< "$OUTPUT"; then
+        fail "unexpected output: $2"
+    else
+        pass
+    fi
+}
+
+# check_count <description> <regex> <n>: exactly n OUTPUT lines match
+check_count() {
+    TESTS_RUN=$((TESTS_RUN + 1))
+    echo -n "  Testing: $1 ... "
+
+    local count
+    count=$(grep -c -- "$2" <<< "$OUTPUT")
+    if [ "$count" -eq "$3" ]; then
+        pass
+    else
+        fail "$count lines match '$2', expected $3"
+    fi
+}
+
+#####################################
+# Fixtures
+#####################################
+
+create_fixtures() {
+    cat > "$TEST_DIR/valid.json" << 'EOF'
+{
+  "project": {"name": "Test", "repository": "/tmp/test"},
+  "workers": [
+    {"id": "backend", "agent": "claude", "branch": "feat/backend"}
+  ]
+}
+EOF
+
+    # Two schema errors: missing repository and an unknown worker role
+    cat > "$TEST_DIR/invalid.json" << 'EOF'
+{
+  "project": {"name": "Test"},
+  "workers": [
+    {"id": "backend", "agent": "claude", "branch": "feat/backend", "role": "nope"}
+  ]
+}
+EOF
+
+    echo '{"project": ' > "$TEST_DIR/broken.json"
+
+    printf '{"project": "\xff"}' > "$TEST_DIR/not-text.json"
+    mkdir "$TEST_DIR/directory.json"
+
+    echo '{"type": "array"}' > "$TEST_DIR/array-schema.json"
+    echo '[1, 2]' > "$TEST_DIR/array.json"
+    echo 'true' > "$TEST_DIR/true-schema.json"
+    echo 'false' > "$TEST_DIR/false-schema.json"
+
+    # Missing project and a workers value of the wrong type
+    echo '{"workers": 3}' > "$TEST_DIR/incomplete.json"
+
+    # Workers first and the other sections after them
+    cat > "$TEST_DIR/sections-last.json" << 'EOF'
+{
+  "workers": [
+    {"id": "a", "agent": "claude", "branch": "a", "role": "code", "memory": {}},
+    {"id": "b", "agent": "aider", "branch": "b", "rules": {"mode": "auto"}}
+  ],
+  "memory": {"embedding_provider": "local"},
+  "agent_rules": {"mode": "manual"},
+  "project": {"name": "Last", "version": 1.5}
+}
+EOF
+}
+
+#####################################
+# Tests
+#####################################
+
+test_validate() {
+    echo ""
+    echo "Testing: validate"
+    echo "═══════════════════════════════"
+
+    run_validator validate "$TEST_DIR/valid.json"
+    check "valid config exits 0" 0 "✓ Valid configuration"
+
+    run_validator validate "$TEST_DIR/invalid.json"
+    check "invalid config stops at the first error by default" 1 \
+        "✗ Invalid configuration (first error shown, use --all-errors for all):"
+    check_count "only one error is reported by default" '^  \[' 1
+
+    run_validator validate "$TEST_DIR/invalid.json" --all-errors
+    check "--all-errors reports every error" 1 \
+        "✗ Invalid configuration:" \
+        "  [project] 'repository' is a required property" \
+        "  [workers -> 0 -> role] 'nope' is not one of ['code', 'plan', 'review', 'test', 'integration', 'research']"
+
+    run_validator validate "$TEST_DIR/missing.json"
+    check "missing config exits 1" 1 "Error: Config file not found at $TEST_DIR/missing.json"
+
+    run_validator validate "$TEST_DIR/valid.json" "$TEST_DIR/invalid.json"
+    check "validate rejects several paths" 2
+
+    run_validator validate "$TEST_DIR/array.json" --schema "$TEST_DIR/array-schema.json"
+    check "custom schema with a non-object root" 0 "✓ Valid configuration"
+
+    run_validator validate "$TEST_DIR/array.json"
+    check "non-object config against the default schema" 1 "  [root] [1, 2] is not of type 'object'"
+
+    run_validator validate "$TEST_DIR/array.json" --schema "$TEST_DIR/true-schema.json"
+    check "true schema accepts any config" 0 "✓ Valid configuration"
+
+    run_validator validate "$TEST_DIR/array.json" --schema "$TEST_DIR/false-schema.json"
+    check "false schema rejects any config" 1 "  [root] False schema does not allow [1, 2]"
+    check_absent "no traceback for a boolean schema" "Traceback"
+
+    # The root prechecks must report what jsonschema itself reports first
+    OUTPUT=$(python3 -c '
+import importlib.util
+import json
+import sys
+
+import jsonschema
+
+spec = importlib.util.spec_from_file_location("config_validator", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+validator = module.ConfigValidator()
+
+for path in sys.argv[2:]:
+    with open(path) as f:
+        config = json.load(f)
+    try:
+        jsonschema.validate(config, validator.schema, cls=jsonschema.Draft7Validator)
+        expected = []
+    except jsonschema.ValidationError as error:
+        expected = [validator._format_error(error)]
+    _, errors = validator.validate_config(config, fail_fast=True)
+    print(("same: " if errors == expected else "differs: ") + path)
+' "$VALIDATOR" "$TEST_DIR/array.json" "$TEST_DIR/incomplete.json" "$TEST_DIR/invalid.json" 2>&1)
+    EXIT_CODE=$?
+    check "precheck comparison runs" 0
+    check_count "prechecks match the validator's first error" '^same: ' 3
+}
+
+test_validate_batch() {
+    echo ""
+    echo "Testing: validate-batch"
+    echo "═══════════════════════════════"
+
+    run_validator validate-batch "$TEST_DIR/valid.json" "$TEST_DIR/valid.json"
+    check "all valid files exit 0" 0 "Validated 2 file(s): 2 valid, 0 invalid"
+
+    run_validator validate-batch "$TEST_DIR/valid.json" "$TEST_DIR/invalid.json" \
+        "$TEST_DIR/broken.json" "$TEST_DIR/missing.json"
+    check "invalid and unreadable files are counted and listed" 1 \
+        "Validated 4 file(s): 1 valid, 3 invalid" \
+        "  ✗ $TEST_DIR/invalid.json" \
+        "  ✗ $TEST_DIR/broken.json" \
+        "  ✗ $TEST_DIR/missing.json" \
+        "Error: Config file not found at $TEST_DIR/missing.json"
+
+    run_validator validate-batch "$TEST_DIR/valid.json" "$TEST_DIR/directory.json" \
+        "$TEST_DIR/not-text.json" "$TEST_DIR/valid.json"
+    check "a directory or undecodable file does not stop the batch" 1 \
+        "Validated 4 file(s): 2 valid, 2 invalid" \
+        "  ✗ $TEST_DIR/directory.json" \
+        "  ✗ $TEST_DIR/not-text.json" \
+        "Error: Cannot read config file $TEST_DIR/directory.json: Is a directory"
+    check_absent "no traceback for unreadable files" "Traceback"
+
+    run_validator validate "$TEST_DIR/directory.json"
+    check "validate reports a directory without a traceback" 1 \
+        "Error: Cannot read config file $TEST_DIR/directory.json: Is a directory"
+
+    run_validator validate-batch "$TEST_DIR/valid.json" "$TEST_DIR/invalid.json" \
+        --schema "$TEST_DIR/no-such-schema.json"
+    check "missing schema stops the batch" 1 \
+        "Error: Schema file not found at $TEST_DIR/no-such-schema.json"
+    check_absent "no summary after a schema error" "Validated "
+}
+
+test_summary() {
+    echo ""
+    echo "Testing: summary"
+    echo "═══════════════════════════════"
+
+    run_validator summary "$TEST_DIR/valid.json"
+    check "summary of a valid config" 0 \
+        "Project: Test" \
+        "Workers: 1" \
+        "  - backend" \
+        "Backward Compatibility: v0.6.2 compatible (no new features)"
+
+    run_validator summary "$TEST_DIR/sections-last.json"
+    check "summary reports v0.7.0 features" 0 \
+        "Workers: 2" \
+        "  Agent Rules: manual mode" \
+        "  Memory: local" \
+        "  - Worker 'b': rules configuration"
+
+    run_validator summary "$TEST_DIR/missing.json"
+    check "summary of a missing config exits 1" 1 "Error: Config file not found at $TEST_DIR/missing.json"
+
+    if ! python3 -c "import ijson" 2>/dev/null; then
+        echo -e "  ${YELLOW}⚠ Skipped${NC}: streaming summary (pip install ijson)"
+        return
+    fi
+
+    # Lowering the threshold forces the ijson path; its summaries must match
+    # the ones built from a full load
+    local configs=("$TEST_DIR/valid.json" "$TEST_DIR/invalid.json" "$TEST_DIR/sections-last.json"
+                   "$PROJECT_ROOT"/examples/*.json)
+    OUTPUT=$(python3 -c '
+import importlib.util
+import sys
+
+spec = importlib.util.spec_from_file_location("config_validator", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+validator = module.ConfigValidator()
+
+for path in sys.argv[2:]:
+    module._STREAM_MIN_BYTES = 1 << 62
+    loaded = validator.get_summary(path)
+    module._STREAM_MIN_BYTES = 0
+    streamed = validator.get_summary(path)
+    print(("same: " if streamed == loaded else "differs: ") + path)
+' "$VALIDATOR" "${configs[@]}" 2>&1)
+    EXIT_CODE=$?
+    check "streamed summaries are produced" 0
+    check_count "streamed summaries match loaded ones" '^same: ' "${#configs[@]}"
+}
+
+#####################################
+# Main
+#####################################
+
+main() {
+    echo "╔════════════════════════════════════════════════════╗"
+    echo "║   Config Validator Test Suite                      ║"
+    echo "╚════════════════════════════════════════════════════╝"
+
+    if ! python3 -c "import jsonschema" 2>/dev/null; then
+        echo -e "${YELLOW}⚠ Skipped${NC} - jsonschema not installed (pip install jsonschema)"
+        exit 0
+    fi
+
+    create_fixtures
+    test_validate
+    test_validate_batch
+    test_summary
+
+    echo ""
+    echo "════════════════════════════════════════════════════"
+    echo "Tests run: $TESTS_RUN, passed: $TESTS_PASSED, failed: $TESTS_FAILED"
+
+    if [ "$TESTS_FAILED" -ne 0 ]; then
+        echo -e "${RED}✗ Some tests failed${NC}"
+        exit 1
+    fi
+    echo -e "${GREEN}✓ All tests passed!${NC}"
+}
+
+main "$@"
@@ -0,0 +1,164 @@
+#!/usr/bin/env bash
+# Test suite for czarina-core/memory_manager.py
+# Covers line-ending handling in stats, symlinked memory files and the
+# read cache
+
+set -uo pipefail
+
+# Colors
+readonly GREEN='\033[0;32m'
+readonly RED='\033[0;31m'
+readonly NC='\033[0m'
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PROJECT_ROOT="$(cd "$SCRIPT_DIR/.." && pwd)"
+MEMORY_MANAGER="$PROJECT_ROOT/czarina-core/memory_manager.py"
+
+TEST_DIR=$(mktemp -d)
+trap 'rm -rf "$TEST_DIR"' EXIT
+
+# Counters
+TESTS_RUN=0
+TESTS_PASSED=0
+TESTS_FAILED=0
+
+#####################################
+# Test Framework
+#####################################
+
+# check_equal <description> <expected> <actual>
+check_equal() {
+    TESTS_RUN=$((TESTS_RUN + 1))
+    echo -n "  Testing: $1 ... "
+
+    if [ "$2" = "$3" ]; then
+        TESTS_PASSED=$((TESTS_PASSED + 1))
+        echo -e "${GREEN}✓ PASS${NC}"
+    else
+        TESTS_FAILED=$((TESTS_FAILED + 1))
+        echo -e "${RED}✗ FAIL${NC} (expected '$2', got '$3')"
+    fi
+}
+
+# stat_field <memory file> <field>: one field of `memory_manager.py stats`
+stat_field() {
+    CZARINA_MEMORY_FILE="$1" python3 "$MEMORY_MANAGER" stats |
+        python3 -c "import json, sys; print(json.load(sys.stdin)['$2'])"
+}
+
+# run_python <code>: run code with memory_manager importable
+run_python() {
+    PYTHONPATH="$PROJECT_ROOT/czarina-core" python3 -c "$1"
+}
+
+#####################################
+# Tests
+#####################################
+
+test_line_endings() {
+    echo ""
+    echo "Testing: stats line endings"
+    echo "═══════════════════════════════"
+
+    local file="$TEST_DIR/crlf.md"
+    printf '# Project Memory: x\r\n\r\n### Session: 2026-01-01 - a\r\n### [p]\r\n### [q]\r\n' > "$file"
+    check_equal "CRLF total_lines" 6 "$(stat_field "$file" total_lines)"
+    check_equal "CRLF session_count" 1 "$(stat_field "$file" session_count)"
+    check_equal "CRLF pattern_count" 2 "$(stat_field "$file" pattern_count)"
+
+    file="$TEST_DIR/cr.md"
+    printf '### [p]\r### Session: 2026-01-01 - a\rc\n' > "$file"
+    check_equal "bare CR total_lines" 4 "$(stat_field "$file" total_lines)"
+    check_equal "bare CR pattern_count" 1 "$(stat_field "$file" pattern_count)"
+
+    # \r as the last byte of the first 1 MiB slice, \n as the first of the next
+    file="$TEST_DIR/straddle.md"
+    python3 -c "import sys; sys.stdout.buffer.write(b'x' * ((1 << 20) - 1) + b'\r\ny')" > "$file"
+    check_equal "CRLF across the slice boundary counts once" 2 "$(stat_field "$file" total_lines)"
+}
+
+test_symlink() {
+    echo ""
+    echo "Testing: symlinked memory file"
+    echo "═══════════════════════════════"
+
+    mkdir -p "$TEST_DIR/shared" "$TEST_DIR/linked/.czarina"
+    echo "old" > "$TEST_DIR/shared/memories.md"
+    chmod 640 "$TEST_DIR/shared/memories.md"
+    ln -s "$TEST_DIR/shared/memories.md" "$TEST_DIR/linked/.czarina/memories.md"
+
+    run_python "
+from memory_manager import MemoryFile
+MemoryFile('$TEST_DIR/linked/.czarina/memories.md').write('new\n')
+"
+
+    local still_link="no"
+    [ -L "$TEST_DIR/linked/.czarina/memories.md" ] && still_link="yes"
+    check_equal "write keeps the symlink" "yes" "$still_link"
+    check_equal "write updates the link target" "new" "$(cat "$TEST_DIR/shared/memories.md")"
+    check_equal "write keeps the target's mode" "640" "$(stat -c %a "$TEST_DIR/shared/memories.md")"
+    check_equal "no temp files left behind" "memories.md" "$(ls -A "$TEST_DIR/shared")"
+}
+
+test_read_cache() {
+    echo ""
+    echo "Testing: read cache"
+    echo "═══════════════════════════════"
+
+    local file="$TEST_DIR/cache.md"
+
+    # Another writer rewrites the file in place at the same size and puts
+    # the old mtime back; the cached copy must not be served
+    check_equal "re-read after a same-mtime rewrite" "HELLO" "$(run_python "
+import os
+from memory_manager import MemoryFile
+memory = MemoryFile('$file')
+memory.write('hello')
+st = os.stat('$file')
+with open('$file', 'r+') as f:
+    f.write('HELLO')
+os.utime('$file', ns=(st.st_atime_ns, st.st_mtime_ns))
+print(memory.read())
+")"
+
+    # Writing the content we last wrote must still replace the other
+    # writer's change
+    check_equal "write after a same-mtime rewrite is not skipped" "hello" "$(run_python "
+import os
+from memory_manager import MemoryFile
+memory = MemoryFile('$file')
+memory.write('hello')
+st = os.stat('$file')
+with open('$file', 'r+') as f:
+    f.write('HELLO')
+os.utime('$file', ns=(st.st_atime_ns, st.st_mtime_ns))
+memory.write('hello')
+print(open('$file').read())
+")"
+}
+
+#####################################
+# Main
+#####################################
+
+main() {
+    echo "╔════════════════════════════════════════════════════╗"
+    echo "║   Memory Manager Test Suite                        ║"
+    echo "╚════════════════════════════════════════════════════╝"
+
+    test_line_endings
+    test_symlink
+    test_read_cache
+
+    echo ""
+    echo "════════════════════════════════════════════════════"
+    echo "Tests run: $TESTS_RUN, passed: $TESTS_PASSED, failed: $TESTS_FAILED"
+
+    if [ "$TESTS_FAILED" -ne 0 ]; then
+        echo -e "${RED}✗ Some tests failed${NC}"
+        exit 1
+    fi
+    echo -e "${GREEN}✓ All tests passed!${NC}"
+}
+
+main "$@"
@@ -31,7 +31,7 @@ test_assert() {
     local command="$2"
     local expected_exit="${3:-0}"
 
-    ((TESTS_RUN++))
+    TESTS_RUN=$((TESTS_RUN + 1))
 
     echo -n "  Testing: $description ... "
 
@@ -43,12 +43,12 @@ test_assert() {
 
     if [[ $actual_exit -eq $expected_exit ]]; then
         echo -e "${GREEN}PASS${NC}"
-        ((TESTS_PASSED++))
+        TESTS_PASSED=$((TESTS_PASSED + 1))
         return 0
     else
         echo -e "${RED}FAIL${NC}"
         echo "    Expected exit code $expected_exit, got $actual_exit"
-        ((TESTS_FAILED++))
+        TESTS_FAILED=$((TESTS_FAILED + 1))
         return 1
     fi
 }
@@ -58,7 +58,7 @@ test_assert_contains() {
     local command="$2"
     local expected_string="$3"
 
-    ((TESTS_RUN++))
+    TESTS_RUN=$((TESTS_RUN + 1))
 
     echo -n "  Testing: $description ... "
 
@@ -67,13 +67,13 @@ test_assert_contains() {
 
     if echo "$output" | grep -q "$expected_string"; then
         echo -e "${GREEN}PASS${NC}"
-        ((TESTS_PASSED++))
+        TESTS_PASSED=$((TESTS_PASSED + 1))
         return 0
     else
         echo -e "${RED}FAIL${NC}"
         echo "    Expected to find: $expected_string"
         echo "    Got: $output"
-        ((TESTS_FAILED++))
+        TESTS_FAILED=$((TESTS_FAILED + 1))
         return 1
     fi
 }
@@ -231,12 +231,12 @@ test_file_size_validation() {
     file_size=$(wc -c < "$MEMORY_FILE" | tr -d ' ')
 
     if [[ $file_size -lt 10240 ]]; then
-        ((TESTS_RUN++))
-        ((TESTS_PASSED++))
+        TESTS_RUN=$((TESTS_RUN + 1))
+        TESTS_PASSED=$((TESTS_PASSED + 1))
         echo -e "  Testing: File size is reasonable ... ${GREEN}PASS${NC}"
     else
-        ((TESTS_RUN++))
-        ((TESTS_FAILED++))
+        TESTS_RUN=$((TESTS_RUN + 1))
+        TESTS_FAILED=$((TESTS_FAILED + 1))
         echo -e "  Testing: File size is reasonable ... ${RED}FAIL${NC}"
         echo "    File size: $file_size bytes (> 10KB)"
     fi